@@ -0,0 +1,792 @@
+"""Effort tracking tool for the Administrative Time Tracker workbooks.
+
+Each employee submits a monthly xlsx (e.g. ``Jane_June2023.xlsx``) with one
+sheet per week.  Every sheet carries a few metadata rows, then a ``Study ID``
+header row, then one row per study with hours logged per day.  This script
+extracts those hours, builds summary reports (xlsx + CSV) and offers a small
+menu of visualisations over the generated ``EffortData.csv``.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+try:
+    import orjson  # optional; ~2-10x faster than stdlib json
+except ImportError:
+    orjson = None
+
+try:
+    # Rust-backed xlsx reader, typically 5-20x faster than openpyxl.
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+DATA_FOLDER = os.path.dirname(os.path.abspath(__file__))
+CACHE_FOLDER = os.path.join(DATA_FOLDER, ".cache")
+KNOWN_EMPLOYEES_FILE = os.path.join(DATA_FOLDER, "known_employees.json")
+REPORT_XLSX = os.path.join(DATA_FOLDER, "EffortReport.xlsx")
+REPORT_CSV = os.path.join(DATA_FOLDER, "EffortData.csv")
+
+# Sheets that never contain per-study hours.
+SKIP_SHEETS = {"summary", "totals"}
+
+_STUDY_RE = re.compile(r"STUDY\d+")
+
+
+# ---------------------------------------------------------------------------
+# Data loading
+# ---------------------------------------------------------------------------
+
+# Directory listing cached on DATA_FOLDER's mtime, so hot paths do not
+# re-stat the folder on every menu action.
+_LS_CACHE = {"mtime_ns": -1, "entries": []}
+
+
+def _listdir():
+    mt = os.stat(DATA_FOLDER).st_mtime_ns
+    if mt != _LS_CACHE["mtime_ns"]:
+        with os.scandir(DATA_FOLDER) as it:
+            entries = [e.name for e in it if e.is_file()]
+        _LS_CACHE["mtime_ns"] = mt
+        _LS_CACHE["entries"] = entries
+    return _LS_CACHE["entries"]
+
+
+def get_current_files():
+    """Return the employee workbook filenames currently in DATA_FOLDER."""
+    return sorted(
+        f for f in _listdir()
+        if f.endswith(".xlsx") and not f.startswith("~") and "_" in f
+        and not f.startswith("EffortReport")
+    )
+
+
+def get_employees():
+    """Employee names, derived from the part of the filename before '_'."""
+    return sorted({f.split("_")[0] for f in get_current_files()})
+
+
+def _file_for_employee(employee):
+    for f in get_current_files():
+        if f.split("_")[0] == employee:
+            return os.path.join(DATA_FOLDER, f)
+    return None
+
+
+def _empty_sheet_frame():
+    return pd.DataFrame(columns=["Study ID", "Hours", "Sheet"])
+
+
+def _extract_study_hours_from_rows(rows, sheet_name):
+    """Pull (Study ID, Hours, Sheet) rows out of one weekly sheet.
+
+    ``rows`` is an iterable of raw value tuples, consumed in a single
+    streaming pass: metadata rows (one of them ``Week of: <date>``) until a
+    header row containing ``Study ID``, then study rows, then a ``Column
+    Total`` footer.  Study ids and hours accumulate into one list per
+    column (structure-of-arrays) rather than a general DataFrame, so no
+    intermediate cell grid is materialised.  Hours are summed across the
+    dated day columns so the trailing unlabelled row-total column is not
+    double counted.
+    """
+    rows = iter(rows)
+    header = None
+    week_of = None
+    for row in rows:
+        for cell in row:
+            if not isinstance(cell, str):
+                continue
+            low = cell.lower()
+            if "study id" in low:
+                header = row
+                break
+            if "week of:" in low:
+                try:
+                    week_of = datetime.strptime(
+                        cell.split(":", 1)[1].strip(), "%m/%d/%Y"
+                    ).date()
+                except (ValueError, IndexError):
+                    week_of = None
+        if header is not None:
+            break
+    if header is None:
+        return _empty_sheet_frame()
+
+    # Day columns look like "Monday-6/5/2023"; the unnamed last column is a
+    # per-row total and must be excluded.
+    day_idx = [
+        i for i, h in enumerate(header)
+        if isinstance(h, str) and "day-" in h.lower()
+    ]
+
+    study_idx = None
+    ids = []
+    hours = []
+    for row in rows:
+        sid = None
+        if study_idx is None:
+            for i, cell in enumerate(row):
+                if isinstance(cell, str) and _STUDY_RE.fullmatch(cell):
+                    study_idx = i
+                    sid = cell
+                    break
+        elif study_idx < len(row):
+            cell = row[study_idx]
+            if isinstance(cell, str) and _STUDY_RE.fullmatch(cell):
+                sid = cell
+        if sid is None:
+            continue
+        ids.append(sid)
+        hours.append(
+            sum(
+                row[i] for i in day_idx
+                if i < len(row) and isinstance(row[i], (int, float))
+            )
+        )
+
+    label = sheet_name
+    if week_of is not None:
+        label = "%s (%s)" % (sheet_name, week_of.isoformat())
+    # Low-cardinality strings repeated per row; categorical codes keep
+    # memory small and make downstream groupby/pivot integer-keyed.
+    return pd.DataFrame(
+        {
+            "Study ID": pd.Categorical(ids),
+            "Hours": np.asarray(hours, dtype=np.float32),
+            "Sheet": pd.Categorical([label] * len(ids)),
+        }
+    )
+
+
+def _cache_paths(employee):
+    return (
+        os.path.join(CACHE_FOLDER, "%s.parquet" % employee),
+        os.path.join(CACHE_FOLDER, "%s.json" % employee),
+    )
+
+
+def _read_cached(employee, path):
+    """Return the cached parquet frame if it still matches the workbook."""
+    parquet_path, meta_path = _cache_paths(employee)
+    if not (os.path.exists(parquet_path) and os.path.exists(meta_path)):
+        return None
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        st = os.stat(path)
+        if (meta.get("mtime_ns") == st.st_mtime_ns
+                and meta.get("size") == st.st_size):
+            return pd.read_parquet(parquet_path)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_cache(employee, path, df):
+    parquet_path, meta_path = _cache_paths(employee)
+    try:
+        os.makedirs(CACHE_FOLDER, exist_ok=True)
+        df.to_parquet(parquet_path)
+        st = os.stat(path)
+        with open(meta_path, "w") as f:
+            json.dump({"mtime_ns": st.st_mtime_ns, "size": st.st_size}, f)
+    except (OSError, ImportError):
+        pass  # cache is best-effort; parsing still works without pyarrow
+
+
+def _drop_cache(employee):
+    for p in _cache_paths(employee):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+def load_employee_data(employee):
+    """Parse one employee's workbook into a (Study ID, Hours, Sheet) frame.
+
+    Parsed frames are cached as parquet under ``.cache/`` keyed on the
+    workbook's mtime and size; a fresh cache entry skips the xlsx parse
+    entirely on repeat menu actions.
+    """
+    path = _file_for_employee(employee)
+    if path is None:
+        return _empty_sheet_frame()
+
+    cached = _read_cached(employee, path)
+    if cached is not None:
+        return cached
+
+    frames = []
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(path)
+        for sn in wb.sheet_names:
+            if sn.lower() in SKIP_SHEETS:
+                continue
+            frames.append(
+                _extract_study_hours_from_rows(
+                    wb.get_sheet_by_name(sn).to_python(), sn
+                )
+            )
+    else:
+        wb = load_workbook(path, read_only=True, data_only=True)
+        # Single traversal of the workbook: wb.worksheets hands back each
+        # sheet in order without a per-name lookup, and iter_rows streams
+        # straight into the extractor without an intermediate DataFrame.
+        for ws in wb.worksheets:
+            if ws.title.lower() in SKIP_SHEETS:
+                continue
+            frames.append(
+                _extract_study_hours_from_rows(
+                    ws.iter_rows(values_only=True), ws.title
+                )
+            )
+        wb.close()
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return _empty_sheet_frame()
+    df = pd.concat(frames, ignore_index=True)
+    _write_cache(employee, path, df)
+    return df
+
+
+def _load_many(employees):
+    """Parse several workbooks in parallel, one worker process per file.
+
+    openpyxl's parser is CPU-bound Python, and the files are independent,
+    so this scales nearly linearly with cores.  load_employee_data is
+    module-level and therefore picklable.
+    """
+    if len(employees) <= 1:
+        return [load_employee_data(e) for e in employees]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        return list(ex.map(load_employee_data, employees))
+
+
+def load_all_data():
+    """Parse every employee workbook and stack them with an Employee column."""
+    employees = get_employees()
+    dfs = []
+    for e, df in zip(employees, _load_many(employees)):
+        if df.empty:
+            continue
+        df["Employee"] = e
+        dfs.append(df)
+    if not dfs:
+        return pd.DataFrame(columns=["Study ID", "Hours", "Sheet", "Employee"])
+    df = pd.concat(dfs, ignore_index=True)
+    # concat of differing category sets falls back to object; re-union.
+    for col in ("Study ID", "Sheet", "Employee"):
+        df[col] = df[col].astype("category")
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Known-employee state
+# ---------------------------------------------------------------------------
+
+def load_known_employees():
+    if not os.path.exists(KNOWN_EMPLOYEES_FILE):
+        return []
+    with open(KNOWN_EMPLOYEES_FILE, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def save_known_employees(employees):
+    employees = sorted(employees)
+    if orjson:
+        payload = orjson.dumps(employees, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(employees, indent=2).encode()
+    with open(KNOWN_EMPLOYEES_FILE, "wb") as f:
+        f.write(payload)
+
+
+def check_for_new_employees():
+    """Record any workbook owners not yet in the known-employee file."""
+    known = set(load_known_employees())
+    current = set(get_employees())
+    new = current - known
+    if new:
+        print("New employees detected: %s" % ", ".join(sorted(new)))
+        save_known_employees(known | new)
+    return sorted(current)
+
+
+def remove_employee(employee):
+    """Forget an employee in the known-employee state file."""
+    known = load_known_employees()
+    if employee not in known:
+        print("Unknown employee: %s" % employee)
+        return
+    known.remove(employee)
+    save_known_employees(known)
+    _drop_cache(employee)
+    print("Removed %s." % employee)
+
+
+# ---------------------------------------------------------------------------
+# Report generation
+# ---------------------------------------------------------------------------
+
+def generate_report():
+    """Build the per-employee xlsx report and the combined EffortData CSV."""
+    employees = check_for_new_employees()
+    if not employees:
+        print("No employee workbooks found.")
+        return
+
+    print("1) All employees")
+    print("2) Select employees by number")
+    choice = input("Choice: ").strip()
+    if choice == "2":
+        sorted_emps = sorted(employees)
+        for i, e in enumerate(sorted_emps, start=1):
+            print("  %d) %s" % (i, e))
+        raw = input("Numbers (comma separated): ")
+        nums = [int(t) for t in raw.replace(",", " ").split() if t.isdigit()]
+        selected = [
+            sorted_emps[i - 1] for i in nums if 1 <= i <= len(sorted_emps)
+        ]
+    else:
+        selected = employees
+    if not selected:
+        print("Nothing selected.")
+        return
+
+    # write_only streams appended rows straight to XML instead of building
+    # a Cell object per value; it also starts with no default sheet.
+    wb = Workbook(write_only=True)
+    all_details = []
+    for emp, df in zip(selected, _load_many(selected)):
+        if df.empty:
+            continue
+        df["Employee"] = emp
+        all_details.append(df)
+
+        ws = wb.create_sheet(title=emp[:31])
+        ws.append(["Study ID", "Hours", "Sheet"])
+        # Hours live as float32 in memory; round through float64 at the
+        # workbook boundary so the xlsx shows 0.32, not 0.3199999928....
+        for sid, hrs, sheet in df[["Study ID", "Hours", "Sheet"]].itertuples(
+            index=False
+        ):
+            ws.append([sid, round(float(hrs), 2), sheet])
+        totals = (
+            df.groupby("Study ID", observed=True, sort=False)["Hours"]
+            .sum().sort_index()
+        )
+        ws.append([])
+        ws.append(["Study ID", "Total Hours"])
+        for sid, hrs in totals.items():
+            ws.append([sid, round(float(hrs), 2)])
+
+    if not all_details:
+        print("No data extracted.")
+        return
+    final_csv = pd.concat(all_details, ignore_index=True)
+    for col in ("Study ID", "Sheet", "Employee"):
+        final_csv[col] = final_csv[col].astype("category")
+
+    summary = (
+        final_csv.groupby(["Study ID", "Employee"], observed=True, sort=False)
+        ["Hours"].sum().unstack("Employee", fill_value=0).sort_index()
+    )
+    ws = wb.create_sheet(title="Overall Summary")
+    ws.append(["Study ID"] + list(summary.columns))
+    for sid, row in summary.iterrows():
+        ws.append([sid] + [round(float(v), 2) for v in row])
+
+    wb.save(REPORT_XLSX)
+    try:
+        # pyarrow's CSV writer runs in C with multithreading, well ahead
+        # of pandas' Python-level to_csv on wide numeric tables.
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        pa_csv.write_csv(
+            pa.Table.from_pandas(final_csv, preserve_index=False), REPORT_CSV
+        )
+    except ImportError:
+        final_csv.to_csv(REPORT_CSV, index=False)
+    print("Wrote %s and %s." % (REPORT_XLSX, REPORT_CSV))
+
+
+def ensure_report_exists():
+    """Generate the EffortData CSV if it is not on disk yet."""
+    if not any(
+        f.startswith("EffortData") and f.endswith(".csv")
+        for f in _listdir()
+    ):
+        print("No report CSV found; generating one first.")
+        generate_report()
+
+
+# ---------------------------------------------------------------------------
+# Plots
+# ---------------------------------------------------------------------------
+
+def _hours_by(df, key):
+    """Total hours per value of ``key``, in appearance order."""
+    return df.groupby(key, observed=True, sort=False)["Hours"].sum()
+
+
+def _hours_pivot(df, index, columns):
+    """``index`` x ``columns`` table of summed hours."""
+    return (
+        df.groupby([index, columns], observed=True, sort=False)["Hours"]
+        .sum().unstack(columns, fill_value=0).sort_index()
+    )
+
+
+def plot_bar_hours(df, per_study=None):
+    """Total hours per study, as a bar chart."""
+    if per_study is None:
+        per_study = _hours_by(df, "Study ID")
+    totals = per_study.sort_values(ascending=False)
+    totals.plot(kind="bar")
+    plt.ylabel("Hours")
+    plt.title("Total Hours per Study")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_pie_proportions(df, per_study=None):
+    """Share of total hours per study."""
+    if per_study is None:
+        per_study = _hours_by(df, "Study ID")
+    totals = per_study[per_study > 0].sort_index()
+    totals.plot(kind="pie", autopct="%1.1f%%")
+    plt.ylabel("")
+    plt.title("Proportion of Hours per Study")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_bar_employee_hours(df, per_emp=None):
+    """Total hours per employee."""
+    if per_emp is None:
+        per_emp = _hours_by(df, "Employee")
+    totals = per_emp.sort_values(ascending=False)
+    totals.plot(kind="bar")
+    plt.ylabel("Hours")
+    plt.title("Total Hours per Employee")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_bar_study_hours_horizontal(df, per_study=None):
+    """Total hours per study, horizontal layout for long study lists."""
+    if per_study is None:
+        per_study = _hours_by(df, "Study ID")
+    totals = per_study.sort_values()
+    totals.plot(kind="barh")
+    plt.xlabel("Hours")
+    plt.title("Total Hours per Study")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_stacked_bar(df, pivot=None):
+    """Hours per employee stacked by study."""
+    if pivot is None:
+        pivot = _hours_pivot(df, "Employee", "Study ID")
+    pivot.plot(kind="bar", stacked=True)
+    plt.ylabel("Hours")
+    plt.title("Hours per Employee by Study")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_heatmap_hours(df, pivot=None):
+    """Week x study heatmap of logged hours."""
+    if pivot is None:
+        pivot = _hours_pivot(df, "Sheet", "Study ID")
+    fig, ax = plt.subplots()
+    im = ax.imshow(pivot.values, aspect="auto", cmap="viridis")
+    ax.set_xticks(range(len(pivot.columns)))
+    ax.set_xticklabels(pivot.columns, rotation=90)
+    ax.set_yticks(range(len(pivot.index)))
+    ax.set_yticklabels(pivot.index)
+    fig.colorbar(im, ax=ax, label="Hours")
+    plt.title("Hours Heatmap (Week x Study)")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_line_hours_by_week(df, per_sheet=None):
+    """Total hours logged per week."""
+    if per_sheet is None:
+        per_sheet = _hours_by(df, "Sheet")
+    totals = per_sheet.sort_index()
+    totals.plot(kind="line", marker="o")
+    plt.ylabel("Hours")
+    plt.title("Total Hours per Week")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_area_chart(df, pivot=None):
+    """Hours per week, one area per study."""
+    if pivot is None:
+        pivot = _hours_pivot(df, "Sheet", "Study ID")
+    pivot.plot(kind="area", stacked=False, alpha=0.5)
+    plt.ylabel("Hours")
+    plt.title("Hours per Week by Study")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_stacked_area_chart(df, pivot=None):
+    """Cumulative weekly hours stacked by study."""
+    if pivot is None:
+        pivot = _hours_pivot(df, "Sheet", "Study ID")
+    pivot.plot(kind="area", stacked=True)
+    plt.ylabel("Hours")
+    plt.title("Stacked Hours per Week by Study")
+    plt.tight_layout()
+    plt.show()
+
+
+# ---------------------------------------------------------------------------
+# Menus
+# ---------------------------------------------------------------------------
+
+# Loaded EffortData frames keyed by path, invalidated on mtime change, so
+# menu iterations do not re-read the same CSV from disk.
+_CSV_CACHE = {}
+
+_EFFORT_CSV_COLUMNS = ["Study ID", "Hours", "Sheet", "Employee"]
+_EFFORT_CSV_DTYPES = {
+    "Study ID": "category",
+    "Hours": "float32",
+    "Sheet": "category",
+    "Employee": "category",
+}
+
+
+def _read_effort_csv(path):
+    """Read an EffortData CSV with known columns and dtypes, cached on mtime.
+
+    Declaring usecols and dtypes up front skips pandas' type inference and
+    restores the categorical/float32 layout the extractor produced.
+    """
+    mtime = os.path.getmtime(path)
+    entry = _CSV_CACHE.get(path)
+    if entry is None or entry[0] != mtime:
+        df = pd.read_csv(
+            path, usecols=_EFFORT_CSV_COLUMNS, dtype=_EFFORT_CSV_DTYPES
+        )
+        entry = (mtime, df)
+        _CSV_CACHE[path] = entry
+    return entry[1]
+
+
+def visualisation_menu():
+    ensure_report_exists()
+    csv_files = [
+        os.path.join(DATA_FOLDER, f) for f in _listdir()
+        if f.startswith("EffortData") and f.endswith(".csv")
+    ]
+    if not csv_files:
+        print("No EffortData CSV available.")
+        return
+    df = _read_effort_csv(csv_files[0])
+
+    # Several plots start from the same aggregation; compute each once per
+    # session instead of re-grouping on every menu choice.
+    per_study = _hours_by(df, "Study ID")
+    per_emp = _hours_by(df, "Employee")
+    per_sheet = _hours_by(df, "Sheet")
+    pivot_emp_study = _hours_pivot(df, "Employee", "Study ID")
+    pivot_sheet_study = _hours_pivot(df, "Sheet", "Study ID")
+
+    plots = {
+        "1": ("Bar: hours per study",
+              partial(plot_bar_hours, df, per_study)),
+        "2": ("Pie: proportion per study",
+              partial(plot_pie_proportions, df, per_study)),
+        "3": ("Bar: hours per employee",
+              partial(plot_bar_employee_hours, df, per_emp)),
+        "4": ("Horizontal bar: hours per study",
+              partial(plot_bar_study_hours_horizontal, df, per_study)),
+        "5": ("Stacked bar: employee by study",
+              partial(plot_stacked_bar, df, pivot_emp_study)),
+        "6": ("Heatmap: week x study",
+              partial(plot_heatmap_hours, df, pivot_sheet_study)),
+        "7": ("Line: hours per week",
+              partial(plot_line_hours_by_week, df, per_sheet)),
+        "8": ("Area: hours per week by study",
+              partial(plot_area_chart, df, pivot_sheet_study)),
+        "9": ("Stacked area: hours per week by study",
+              partial(plot_stacked_area_chart, df, pivot_sheet_study)),
+    }
+    while True:
+        print("\nVisualisations:")
+        for key, (label, _) in plots.items():
+            print("  %s) %s" % (key, label))
+        print("  0) Back")
+        ch = input("Choice: ").strip()
+        if ch == "0":
+            return
+        if ch in plots:
+            plots[ch][1]()
+        else:
+            print("Invalid choice.")
+
+
+def advanced_mode():
+    ensure_report_exists()
+    csv_files = [
+        os.path.join(DATA_FOLDER, f) for f in _listdir()
+        if f.startswith("EffortData") and f.endswith(".csv")
+    ]
+    if not csv_files:
+        print("No EffortData CSV available.")
+        return
+
+    while True:
+        print("\nAdvanced mode:")
+        print("  1) Filter by day of week")
+        print("  2) Top N studies by hours")
+        print("  3) Per-employee breakdown")
+        print("  4) Compare two employees")
+        print("  5) Weekly trend for a study")
+        print("  0) Back")
+        ch = input("Choice: ").strip()
+        if ch == "0":
+            return
+
+        if ch == "1":
+            df = _read_effort_csv(csv_files[0])
+            day = input("Weekday (0=Monday .. 6=Sunday): ").strip()
+            if not day.isdigit():
+                print("Invalid weekday.")
+                continue
+            day_num = int(day)
+            # One C-level datetime parse over the column; unparseable
+            # labels become NaT and never match.
+            dates = pd.to_datetime(
+                df["Sheet"].astype(str).str.extract(
+                    r"(\d{4}-\d{2}-\d{2})", expand=False
+                ),
+                errors="coerce",
+            )
+            filtered = df[dates.dt.weekday == day_num]
+            if filtered.empty:
+                print("No rows for that weekday.")
+            else:
+                print(
+                    filtered.groupby("Study ID", observed=True, sort=False)
+                    ["Hours"].sum().sort_index()
+                    .astype("float64").round(2)
+                )
+        elif ch == "2":
+            df = _read_effort_csv(csv_files[0])
+            n = input("N: ").strip()
+            n = int(n) if n.isdigit() else 5
+            totals = (
+                df.groupby("Study ID", observed=True, sort=False)["Hours"]
+                .sum()
+            )
+            print(
+                totals.sort_values(ascending=False).head(n)
+                .astype("float64").round(2)
+            )
+        elif ch in ("3", "4", "5"):
+            df = _read_effort_csv(csv_files[0])
+            employees = list(df["Employee"].unique())
+            sorted_emps = sorted(employees)
+            if ch == "3":
+                for i, e in enumerate(sorted_emps, start=1):
+                    print("  %d) %s" % (i, e))
+                pick = input("Employee number: ").strip()
+                if not pick.isdigit() or not (
+                    1 <= int(pick) <= len(sorted_emps)
+                ):
+                    print("Invalid selection.")
+                    continue
+                emp = sorted_emps[int(pick) - 1]
+                sub = df[df["Employee"] == emp]
+                print(
+                    sub.groupby("Study ID", observed=True, sort=False)
+                    ["Hours"].sum().sort_index()
+                    .astype("float64").round(2)
+                )
+            elif ch == "4":
+                for i, e in enumerate(sorted_emps, start=1):
+                    print("  %d) %s" % (i, e))
+                picks = input("Two numbers (comma separated): ")
+                nums = [
+                    int(t) for t in picks.replace(",", " ").split()
+                    if t.isdigit()
+                ]
+                chosen = [
+                    sorted_emps[i - 1] for i in nums
+                    if 1 <= i <= len(sorted_emps)
+                ]
+                if len(chosen) != 2:
+                    print("Pick exactly two employees.")
+                    continue
+                sub = df[df["Employee"].isin(chosen)]
+                print(
+                    sub.groupby(
+                        ["Study ID", "Employee"], observed=True, sort=False
+                    )["Hours"].sum()
+                    .unstack("Employee", fill_value=0).sort_index()
+                    .astype("float64").round(2)
+                )
+            else:
+                sid = input("Study ID (e.g. STUDY001): ").strip()
+                sub = df[df["Study ID"] == sid]
+                if sub.empty:
+                    print("No rows for %s." % sid)
+                else:
+                    print(
+                        sub.groupby("Sheet", observed=True, sort=False)
+                        ["Hours"].sum().sort_index()
+                        .astype("float64").round(2)
+                    )
+        else:
+            print("Invalid choice.")
+
+
+def main():
+    check_for_new_employees()
+    while True:
+        print("\nEffort tracker:")
+        print("  1) Generate report")
+        print("  2) Visualisations")
+        print("  3) Advanced mode")
+        print("  4) List employees")
+        print("  5) Remove employee")
+        print("  0) Exit")
+        choice = input("Choice: ").strip()
+        if choice == "1":
+            generate_report()
+        elif choice == "2":
+            visualisation_menu()
+        elif choice == "3":
+            advanced_mode()
+        elif choice == "4":
+            for e in get_employees():
+                print("  - %s" % e)
+        elif choice == "5":
+            name = input("Employee name: ").strip()
+            remove_employee(name)
+        elif choice == "0":
+            return
+        else:
+            print("Invalid choice.")
+
+
+if __name__ == "__main__":
+    main()